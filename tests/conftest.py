@@ -0,0 +1,28 @@
+"""
+tests/conftest.py
+Shared pytest configuration for the DevOps REST API tests.
+"""
+
+import os
+
+import psutil
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_cpu_sampling():
+    """
+    Stub psutil.cpu_percent for the whole session so tests never sleep
+    inside cpu_percent(interval=...). The suite only checks response shape
+    and value ranges, not real utilization, and the sampling sleep otherwise
+    dominates CI wall time.
+    """
+    def _cpu_percent(*args, **kwargs):
+        if kwargs.get("percpu"):
+            return [0.0] * (os.cpu_count() or 1)
+        return 0.0
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(psutil, "cpu_percent", _cpu_percent)
+    yield
+    mp.undo()
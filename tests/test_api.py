@@ -17,23 +17,69 @@ from app.main import app
 client = TestClient(app)
 
 
+# Shared class-scoped responses: each endpoint is hit once per test class
+# instead of once per test, which keeps the suite from re-running the
+# (potentially blocking) psutil sampling behind every assertion.
+
+@pytest.fixture(scope="class")
+def root_response():
+    return client.get("/")
+
+
+@pytest.fixture(scope="class")
+def health_response():
+    return client.get("/health")
+
+
+@pytest.fixture(scope="class")
+def system_response():
+    return client.get("/system")
+
+
+@pytest.fixture(scope="class")
+def metrics_response():
+    return client.get("/metrics")
+
+
+@pytest.fixture(scope="class")
+def cpu_response():
+    return client.get("/metrics/cpu")
+
+
+@pytest.fixture(scope="class")
+def memory_response():
+    return client.get("/metrics/memory")
+
+
+@pytest.fixture(scope="class")
+def disk_response():
+    return client.get("/metrics/disk")
+
+
+@pytest.fixture(scope="class")
+def network_response():
+    return client.get("/metrics/network")
+
+
+@pytest.fixture(scope="class")
+def not_found_response():
+    return client.get("/nonexistent")
+
+
 # ── Root endpoint tests ───────────────────────────────────────────────────────
 
 class TestRoot:
-    def test_root_returns_200(self):
-        response = client.get("/")
-        assert response.status_code == 200
+    def test_root_returns_200(self, root_response):
+        assert root_response.status_code == 200
 
-    def test_root_has_api_info(self):
-        response = client.get("/")
-        data = response.json()
+    def test_root_has_api_info(self, root_response):
+        data = root_response.json()
         assert "api" in data
         assert "version" in data
         assert "endpoints" in data
 
-    def test_root_lists_endpoints(self):
-        response = client.get("/")
-        data = response.json()
+    def test_root_lists_endpoints(self, root_response):
+        data = root_response.json()
         endpoints = data["endpoints"]
         assert "/health" in endpoints.values()
         assert "/metrics" in endpoints.values()
@@ -42,24 +88,20 @@ class TestRoot:
 # ── Health endpoint tests ─────────────────────────────────────────────────────
 
 class TestHealth:
-    def test_health_returns_200(self):
-        response = client.get("/health")
-        assert response.status_code == 200
+    def test_health_returns_200(self, health_response):
+        assert health_response.status_code == 200
 
-    def test_health_has_status(self):
-        response = client.get("/health")
-        data = response.json()
+    def test_health_has_status(self, health_response):
+        data = health_response.json()
         assert data["status"] == "healthy"
 
-    def test_health_has_timestamp(self):
-        response = client.get("/health")
-        data = response.json()
+    def test_health_has_timestamp(self, health_response):
+        data = health_response.json()
         assert "timestamp" in data
         assert data["timestamp"].endswith("Z")
 
-    def test_health_has_uptime(self):
-        response = client.get("/health")
-        data = response.json()
+    def test_health_has_uptime(self, health_response):
+        data = health_response.json()
         assert "uptime_seconds" in data
         assert data["uptime_seconds"] > 0
 
@@ -67,60 +109,51 @@ class TestHealth:
 # ── System endpoint tests ─────────────────────────────────────────────────────
 
 class TestSystem:
-    def test_system_returns_200(self):
-        response = client.get("/system")
-        assert response.status_code == 200
+    def test_system_returns_200(self, system_response):
+        assert system_response.status_code == 200
 
-    def test_system_has_required_fields(self):
-        response = client.get("/system")
-        data = response.json()
-        required = ["hostname", "os", "os_release", "architecture", 
+    def test_system_has_required_fields(self, system_response):
+        data = system_response.json()
+        required = ["hostname", "os", "os_release", "architecture",
                    "python_version", "boot_time", "uptime_seconds"]
         for field in required:
             assert field in data
 
-    def test_system_hostname_not_empty(self):
-        response = client.get("/system")
-        data = response.json()
+    def test_system_hostname_not_empty(self, system_response):
+        data = system_response.json()
         assert len(data["hostname"]) > 0
 
-    def test_system_uptime_positive(self):
-        response = client.get("/system")
-        data = response.json()
+    def test_system_uptime_positive(self, system_response):
+        data = system_response.json()
         assert data["uptime_seconds"] > 0
 
 
 # ── Metrics endpoint tests ────────────────────────────────────────────────────
 
 class TestMetrics:
-    def test_metrics_returns_200(self):
-        response = client.get("/metrics")
-        assert response.status_code == 200
+    def test_metrics_returns_200(self, metrics_response):
+        assert metrics_response.status_code == 200
 
-    def test_metrics_has_all_sections(self):
-        response = client.get("/metrics")
-        data = response.json()
-        sections = ["timestamp", "system", "cpu", "memory", "disk", 
+    def test_metrics_has_all_sections(self, metrics_response):
+        data = metrics_response.json()
+        sections = ["timestamp", "system", "cpu", "memory", "disk",
                    "network", "top_processes"]
         for section in sections:
             assert section in data
 
-    def test_metrics_cpu_has_percent(self):
-        response = client.get("/metrics")
-        data = response.json()
+    def test_metrics_cpu_has_percent(self, metrics_response):
+        data = metrics_response.json()
         assert "percent" in data["cpu"]
         assert 0 <= data["cpu"]["percent"] <= 100
 
-    def test_metrics_memory_has_ram(self):
-        response = client.get("/metrics")
-        data = response.json()
+    def test_metrics_memory_has_ram(self, metrics_response):
+        data = metrics_response.json()
         assert "ram" in data["memory"]
         assert "percent" in data["memory"]["ram"]
         assert 0 <= data["memory"]["ram"]["percent"] <= 100
 
-    def test_metrics_disk_has_path(self):
-        response = client.get("/metrics")
-        data = response.json()
+    def test_metrics_disk_has_path(self, metrics_response):
+        data = metrics_response.json()
         assert "path" in data["disk"]
         assert data["disk"]["path"] == "/"
 
@@ -128,43 +161,36 @@ class TestMetrics:
 # ── Individual metric endpoint tests ──────────────────────────────────────────
 
 class TestCpuEndpoint:
-    def test_cpu_returns_200(self):
-        response = client.get("/metrics/cpu")
-        assert response.status_code == 200
+    def test_cpu_returns_200(self, cpu_response):
+        assert cpu_response.status_code == 200
 
-    def test_cpu_has_timestamp_and_cpu(self):
-        response = client.get("/metrics/cpu")
-        data = response.json()
+    def test_cpu_has_timestamp_and_cpu(self, cpu_response):
+        data = cpu_response.json()
         assert "timestamp" in data
         assert "cpu" in data
 
-    def test_cpu_percent_in_range(self):
-        response = client.get("/metrics/cpu")
-        data = response.json()
+    def test_cpu_percent_in_range(self, cpu_response):
+        data = cpu_response.json()
         assert 0 <= data["cpu"]["percent"] <= 100
 
 
 class TestMemoryEndpoint:
-    def test_memory_returns_200(self):
-        response = client.get("/metrics/memory")
-        assert response.status_code == 200
+    def test_memory_returns_200(self, memory_response):
+        assert memory_response.status_code == 200
 
-    def test_memory_has_ram_and_swap(self):
-        response = client.get("/metrics/memory")
-        data = response.json()
+    def test_memory_has_ram_and_swap(self, memory_response):
+        data = memory_response.json()
         assert "memory" in data
         assert "ram" in data["memory"]
         assert "swap" in data["memory"]
 
 
 class TestDiskEndpoint:
-    def test_disk_returns_200(self):
-        response = client.get("/metrics/disk")
-        assert response.status_code == 200
+    def test_disk_returns_200(self, disk_response):
+        assert disk_response.status_code == 200
 
-    def test_disk_default_path(self):
-        response = client.get("/metrics/disk")
-        data = response.json()
+    def test_disk_default_path(self, disk_response):
+        data = disk_response.json()
         assert data["disk"]["path"] == "/"
 
     def test_disk_custom_path(self):
@@ -178,13 +204,11 @@ class TestDiskEndpoint:
 
 
 class TestNetworkEndpoint:
-    def test_network_returns_200(self):
-        response = client.get("/metrics/network")
-        assert response.status_code == 200
+    def test_network_returns_200(self, network_response):
+        assert network_response.status_code == 200
 
-    def test_network_has_sent_and_recv(self):
-        response = client.get("/metrics/network")
-        data = response.json()
+    def test_network_has_sent_and_recv(self, network_response):
+        data = network_response.json()
         assert "network" in data
         assert "bytes_sent_mb" in data["network"]
         assert "bytes_recv_mb" in data["network"]
@@ -208,9 +232,9 @@ class TestProcesses:
         data = response.json()
         assert len(data["processes"]) <= 5
 
-    def test_processes_limit_too_high_returns_400(self):
+    def test_processes_limit_too_high_returns_422(self):
         response = client.get("/processes?limit=100")
-        assert response.status_code == 400
+        assert response.status_code == 422
 
     def test_processes_have_required_fields(self):
         response = client.get("/processes?limit=1")
@@ -226,16 +250,14 @@ class TestProcesses:
 # ── Error handling tests ──────────────────────────────────────────────────────
 
 class TestErrorHandling:
-    def test_404_custom_handler(self):
-        response = client.get("/nonexistent")
-        assert response.status_code == 404
-        data = response.json()
+    def test_404_custom_handler(self, not_found_response):
+        assert not_found_response.status_code == 404
+        data = not_found_response.json()
         assert "error" in data
         assert "available_endpoints" in data
 
-    def test_404_lists_real_endpoints(self):
-        response = client.get("/nonexistent")
-        data = response.json()
+    def test_404_lists_real_endpoints(self, not_found_response):
+        data = not_found_response.json()
         endpoints = data["available_endpoints"]
         assert "/health" in endpoints
         assert "/metrics" in endpoints